@@ -1,3 +1,28 @@
 from django.contrib import admin
 
-# Register your models here.
+from subjects.models import Subject
+
+
+@admin.register(Subject)
+class SubjectAdmin(admin.ModelAdmin):
+    """
+    Configuración del admin para el modelo Subject.
+    Permite listar las materias de un profesor desde su ficha (?teacher__id__exact=<pk>).
+    Es de solo lectura: la gestión de materias se hace desde las vistas de la app
+    (SubjectForm y SubjectDeleteView aplican las reglas de negocio).
+    """
+    list_display = ("name", "teacher", "quota")
+    search_fields = ("name",)
+    list_select_related = ("teacher",)
+    # Sin acciones masivas (delete_selected borraría inscripciones en cascada)
+    actions = None
+
+    # Impedir añadir, editar o eliminar materias desde el admin
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
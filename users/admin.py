@@ -1,11 +1,36 @@
+from functools import lru_cache
+
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 from django.contrib.admin.sites import NotRegistered
+from django.db.models import Count
 from django.forms.widgets import HiddenInput
+from django.urls import reverse
+from django.utils.html import format_html
 
 from users.models import User, Admin
-from subjects.models import Subject
 from users.models.teacher import Teacher
+from users.services import AdminService
+
+
+# Precalculados una sola vez al cargar el módulo (get_form se ejecuta en cada GET/POST)
+_HIDDEN_IS_STAFF_WIDGET = HiddenInput()
+_HIDDEN_IS_SUPERUSER_WIDGET = HiddenInput()
+
+
+@lru_cache(maxsize=2)
+def _form_customization(is_superuser: bool):
+    """
+    Retorna (role_choices, hide_permission_fields) para el formulario de usuario.
+    Solo hay dos combinaciones posibles, así que se calculan una vez y se reutilizan.
+    - Superuser: sin restricciones (None, False).
+    - Resto: roles sin ADMIN y campos de permisos ocultos.
+    """
+    if is_superuser:
+        return None, False
+
+    role_choices = tuple(c for c in getattr(User, "ROLE_CHOICES", ()) if c[0] != "ADMIN")
+    return role_choices, True
 
 
 class CustomUserAdmin(UserAdmin):
@@ -47,16 +72,16 @@ class CustomUserAdmin(UserAdmin):
         form = super().get_form(request, obj, **kwargs)
 
         # Restricción principal: Si el usuario no es superuser
-        if not request.user.is_superuser:
-            role_choices = getattr(User, "ROLE_CHOICES", [])
-            if role_choices and "role" in form.base_fields:
-                choices = [c for c in role_choices if c[0] != "ADMIN"]
-                form.base_fields["role"].choices = choices  # type: ignore[attr-defined]
+        role_choices, hide_permission_fields = _form_customization(request.user.is_superuser)
 
+        if role_choices and "role" in form.base_fields:
+            form.base_fields["role"].choices = role_choices  # type: ignore[attr-defined]
+
+        if hide_permission_fields:
             if "is_staff" in form.base_fields:
-                form.base_fields["is_staff"].widget = HiddenInput()
+                form.base_fields["is_staff"].widget = _HIDDEN_IS_STAFF_WIDGET
             if "is_superuser" in form.base_fields:
-                form.base_fields["is_superuser"].widget = HiddenInput()
+                form.base_fields["is_superuser"].widget = _HIDDEN_IS_SUPERUSER_WIDGET
 
         return form
 
@@ -121,6 +146,13 @@ class AdminAdmin(admin.ModelAdmin):
     # Ordenamiento por defecto
     ordering = ("-hire_date",)
 
+    # Trae el usuario asociado en la misma consulta del listado (evita N+1 queries)
+    list_select_related = ("user",)
+
+    # El selector de usuario se carga por AJAX (búsqueda en CustomUserAdmin)
+    # en lugar de renderizar un <option> por cada User del sistema
+    autocomplete_fields = ("user",)
+
     # Método para mostrar el email del usuario
     def user_email(self, obj):
         """Muestra el email del usuario asociado."""
@@ -136,26 +168,12 @@ class AdminAdmin(admin.ModelAdmin):
     user_is_active.admin_order_field = "user__is_active"
     user_is_active.boolean = True  # Muestra un ícono de checkmark/X en lugar de True/False
 
-    def get_queryset(self, request):
-        """
-        Sobrescribimos el queryset para optimizar la carga de datos relacionados.
-        Usamos select_related para traer la información del usuario en la misma consulta SQL
-        y evitar el problema de N+1 queries.
-        """
-        qs = super().get_queryset(request)
-        return qs.select_related('user')
-
     # Acciones personalizadas
     actions = ["activate_admins", "deactivate_admins"]
 
     def activate_admins(self, request, queryset):
         """Activa los administradores seleccionados."""
-        updated = 0
-        for admin in queryset:
-            if admin.user:
-                admin.user.is_active = True
-                admin.user.save(update_fields=['is_active'])
-                updated += 1
+        updated = AdminService.activate_admins_bulk(queryset)
         self.message_user(
             request,
             f"{updated} administrador(es) activado(s) correctamente.",
@@ -164,12 +182,7 @@ class AdminAdmin(admin.ModelAdmin):
 
     def deactivate_admins(self, request, queryset):
         """Desactiva los administradores seleccionados."""
-        updated = 0
-        for admin in queryset:
-            if admin.user:
-                admin.user.is_active = False
-                admin.user.save(update_fields=['is_active'])
-                updated += 1
+        updated = AdminService.deactivate_admins_bulk(queryset)
         self.message_user(
             request,
             f"{updated} administrador(es) desactivado(s) correctamente.",
@@ -177,25 +190,6 @@ class AdminAdmin(admin.ModelAdmin):
     deactivate_admins.short_description = "Desactivar administradores seleccionados"
 
 
-class SubjectTeacherInline(admin.TabularInline):
-    """
-    Inline para mostrar las materias asignadas a un profesor.
-    """
-    model = Subject
-    fk_name = "teacher"
-    fields = ("name",)
-    readonly_fields = ("name",)
-    extra = 0
-    # Impedir añadir o eliminar asignaciones
-    can_delete = False
-
-    def has_add_permission(self, request, obj=None):
-        return False
-
-    def has_change_permission(self, request, obj=None):
-        return False
-
-
 @admin.register(Teacher)
 class TeacherAdmin(admin.ModelAdmin):
     """
@@ -204,7 +198,7 @@ class TeacherAdmin(admin.ModelAdmin):
     list_display = ("full_name", "dni", "academic_degree", "subject_count", "hire_date", "is_active")
     list_filter = ("user__is_active", "academic_degree", "hire_date")
     search_fields = ("name", "surname", "dni", "user__email")
-    inlines = [SubjectTeacherInline]
+    list_select_related = ("user",)
 
     fieldsets = (
         ("Información Personal", {
@@ -219,17 +213,44 @@ class TeacherAdmin(admin.ModelAdmin):
         ("Usuario Asociado", {
             "fields": ("user",)
         }),
+        ("Materias Asignadas", {
+            "fields": ("subjects_link",)
+        }),
     )
 
-    readonly_fields = ("user",)
+    readonly_fields = ("user", "subjects_link")
+
+    def get_queryset(self, request):
+        """
+        Trae el usuario en la misma consulta y cuenta las materias en la DB
+        para evitar una consulta extra por fila en el listado.
+        """
+        qs = super().get_queryset(request)
+        return qs.select_related("user").annotate(_subject_count=Count("subjects"))
 
     def full_name(self, obj):
         return f"{obj.name} {obj.surname}"
     full_name.short_description = "Nombre Completo"
 
     def subject_count(self, obj):
-        return obj.subjects.count() if obj.user else 0
+        return obj._subject_count
     subject_count.short_description = "N° de Materias"
+    subject_count.admin_order_field = "_subject_count"
+
+    def subjects_link(self, obj):
+        """
+        Enlace al listado de materias del profesor, en lugar de renderizarlas en línea.
+        """
+        if not obj.pk:
+            return "-"
+        url = reverse("admin:subjects_subject_changelist")
+        return format_html(
+            '<a href="{}?teacher__id__exact={}">Ver materias ({})</a>',
+            url,
+            obj.pk,
+            obj._subject_count,
+        )
+    subjects_link.short_description = "Materias"
 
     def is_active(self, obj):
         return obj.user.is_active if obj.user else False
@@ -20,9 +20,8 @@ class CustomUserManager(DjangoUserManager):
         if role not in allowed_roles:
             raise ValueError(f"El rol debe ser uno de {', '.join(sorted(allowed_roles))}")
 
-    def create_user(
+    def build_user(
         self,
-        username_ignored: str = None,
         email: str = None,
         dni: Optional[str] = None,
         role: str = None,
@@ -30,9 +29,10 @@ class CustomUserManager(DjangoUserManager):
         **extra_fields,
     ) -> "User":
         """
-        Crear y guardar un usuario con políticas específicas según el rol:
+        Construir (sin guardar) un usuario con políticas específicas según el rol:
         - STUDENT/TEACHER: la contraseña es el DNI. No existen contraseñas manuales. El campo 'is_first_login' es True.
         - ADMIN: la contraseña es manual. El campo 'is_first_login' es False.
+        Permite insertar el usuario luego con save() o bulk_create().
         """
         # Validaciones
         self._validate_common(email, role)
@@ -77,6 +77,27 @@ class CustomUserManager(DjangoUserManager):
         )
 
         user.set_password(final_password)
+        return user
+
+    def create_user(
+        self,
+        username_ignored: str = None,
+        email: str = None,
+        dni: Optional[str] = None,
+        role: str = None,
+        password: Optional[str] = None,
+        **extra_fields,
+    ) -> "User":
+        """
+        Crear y guardar un usuario aplicando las políticas por rol de build_user.
+        """
+        user = self.build_user(
+            email=email,
+            dni=dni,
+            role=role,
+            password=password,
+            **extra_fields
+        )
         user.save(using=self._db)
         return user
 
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-15 14:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0008_alter_admin_phone_alter_teacher_phone'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='admin',
+            index=models.Index(fields=['-hire_date', '-id'], name='admin_hire_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='teacher',
+            index=models.Index(fields=['surname', 'name', 'id'], name='teacher_name_idx'),
+        ),
+    ]
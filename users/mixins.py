@@ -1,7 +1,15 @@
+import base64
+import binascii
+import json
+import math
+from dataclasses import dataclass
+
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
-from django.core.exceptions import PermissionDenied
-from django.http import HttpRequest
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.http import Http404, HttpRequest
 from django.shortcuts import redirect
 
 
@@ -119,3 +127,130 @@ class TeacherRequiredMixin(LoginRequiredMixin, UserPassesTestMixin):
 
         # Si no está logueado, lo manda al login
         return super().handle_no_permission()
+
+
+@dataclass
+class KeysetPage:
+    """
+    Página obtenida con paginación por cursor (keyset).
+    Expone la misma interfaz mínima que usa la plantilla keyset_pagination.html.
+    """
+    object_list: list
+    has_next: bool
+    has_previous: bool
+    next_cursor: str = ""
+    previous_cursor: str = ""
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+
+class KeysetPaginationMixin:
+    """
+    Mixin para ListView que reemplaza la paginación OFFSET/LIMIT por paginación por cursor.
+
+    Cada página se obtiene con un rango sobre las columnas de keyset_ordering
+    (?after=<cursor> o ?before=<cursor>), sin COUNT(*) ni escaneo de OFFSET.
+    keyset_ordering debe terminar en una columna única (por ejemplo "pk")
+    para que el orden sea total.
+    """
+    request: HttpRequest
+    keyset_ordering: tuple = ("pk",)
+
+    def paginate_queryset(self, queryset, page_size):
+        """
+        Devuelve (paginator, page, object_list, is_paginated) como ListView.
+        No hay paginator: el total de registros no se calcula.
+        """
+        after = self.request.GET.get("after")
+        before = self.request.GET.get("before")
+        backwards = bool(before)
+        ordering = self.keyset_ordering
+
+        if backwards:
+            # Se recorre en orden inverso desde el cursor y luego se da vuelta la página
+            ordering = [field[1:] if field.startswith("-") else f"-{field}" for field in ordering]
+        if after or before:
+            values = self._decode_cursor(before or after)
+            try:
+                queryset = queryset.filter(self._keyset_filter(values, backwards))
+            except (ValidationError, TypeError, ValueError, OverflowError):
+                # Valores que no corresponden al tipo de la columna (p. ej. una fecha inválida)
+                raise Http404("Cursor inválido.")
+
+        # Se pide un registro extra para saber si hay más páginas en esa dirección
+        rows = list(queryset.order_by(*ordering)[:page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+
+        if backwards:
+            rows.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, bool(after)
+
+        page = KeysetPage(
+            object_list=rows,
+            has_next=has_next and bool(rows),
+            has_previous=has_previous and bool(rows),
+            next_cursor=self._encode_cursor(rows[-1]) if rows else "",
+            previous_cursor=self._encode_cursor(rows[0]) if rows else "",
+        )
+        return None, page, rows, page.has_next or page.has_previous
+
+    def _keyset_filter(self, values, backwards):
+        """
+        Construye (a > x) OR (a = x AND b > y) OR ... según la dirección de cada columna.
+        """
+        if len(values) != len(self.keyset_ordering):
+            raise Http404("Cursor inválido.")
+
+        condition = Q()
+        equal_prefix = Q()
+        for field, value in zip(self.keyset_ordering, values):
+            descending = field.startswith("-")
+            name = field.lstrip("-")
+            lookup = "lt" if descending != backwards else "gt"
+            condition |= equal_prefix & Q(**{f"{name}__{lookup}": value})
+            equal_prefix &= Q(**{name: value})
+        return condition
+
+    def _encode_cursor(self, obj):
+        values = [getattr(obj, field.lstrip("-")) for field in self.keyset_ordering]
+        raw = json.dumps(values, cls=DjangoJSONEncoder).encode()
+        return base64.urlsafe_b64encode(raw).decode()
+
+    def _decode_cursor(self, cursor):
+        try:
+            # parse_constant rechaza Infinity, -Infinity y NaN (no son JSON estándar)
+            values = json.loads(
+                base64.urlsafe_b64decode(cursor.encode()),
+                parse_constant=self._reject_json_constant,
+            )
+        except (binascii.Error, ValueError):
+            raise Http404("Cursor inválido.")
+
+        # Un cursor válido es una lista de valores simples, uno por columna de keyset_ordering
+        if not isinstance(values, list) or not all(self._is_cursor_value(value) for value in values):
+            raise Http404("Cursor inválido.")
+        return values
+
+    @staticmethod
+    def _reject_json_constant(constant):
+        raise ValueError(f"Constante JSON no permitida: {constant}")
+
+    @staticmethod
+    def _is_cursor_value(value):
+        """
+        Acepta cadenas, floats finitos y enteros que entran en una columna BIGINT.
+        """
+        if isinstance(value, bool):
+            return False
+        if isinstance(value, int):
+            return -2**63 <= value < 2**63
+        if isinstance(value, float):
+            return math.isfinite(value)
+        return isinstance(value, str)
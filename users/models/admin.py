@@ -75,5 +75,7 @@ class Admin(Person):
         ordering = ["-hire_date"]
         indexes = [
             models.Index(fields=["department"], name="admin_department_idx"),
+            # Coincide con el orden del listado paginado por cursor (-hire_date, -pk)
+            models.Index(fields=["-hire_date", "-id"], name="admin_hire_date_idx"),
         ]
         
\ No newline at end of file
@@ -69,9 +69,15 @@ class Person(models.Model):
     def __str__(self):
         return f"{self.surname}, {self.name}"
 
-    def save(self, *args, **kwargs):
+    def normalize_names(self):
+        """
+        Normaliza nombre y apellido (sin espacios extremos y en formato título).
+        """
         if self.name:
             self.name = self.name.strip().title()
         if self.surname:
             self.surname = self.surname.strip().title()
+
+    def save(self, *args, **kwargs):
+        self.normalize_names()
         super().save(*args, **kwargs)
@@ -40,6 +40,10 @@ class Teacher(Person):
         verbose_name = "Profesor"
         verbose_name_plural = "Profesores"
         ordering = ["-hire_date"]
+        indexes = [
+            # Coincide con el orden del listado paginado por cursor (surname, name, pk)
+            models.Index(fields=["surname", "name", "id"], name="teacher_name_idx"),
+        ]
 
     def get_subjects(self):
         return self.subjects.all()
@@ -1,12 +1,18 @@
+from collections import Counter
+
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.db.models import Value
 from django.utils import timezone
 
 from users.models import Admin
 
 User = get_user_model()
 
+# Campos obligatorios para crear un administrador (se define una sola vez al cargar el módulo)
+_REQUIRED_ADMIN_FIELDS = ('name', 'surname', 'dni', 'email', 'hire_date', 'password')
+
 
 class AdminService:
     """
@@ -15,16 +21,96 @@ class AdminService:
     """
 
     @staticmethod
-    @transaction.atomic
     def create_admin(data: dict) -> Admin:
         """
         Crea un usuario con rol ADMIN y su perfil de Admin asociado de forma atómica.
         Recibe un diccionario con los datos necesarios para crear ambos objetos.
         Retorna el objeto Admin creado.
+        Las validaciones y el hash de la contraseña se ejecutan antes de abrir
+        la transacción, que solo envuelve las dos inserciones.
+        """
+        AdminService._validate_admin_data(data)
+
+        # Validaciones de unicidad (DNI y email en una sola consulta).
+        # Dan mensajes claros en el caso habitual; la garantía final la dan los
+        # índices únicos de User.email y Admin.dni al insertar (ver más abajo).
+        # El DNI de Student/Teacher está en otras tablas y solo se puede verificar aquí.
+        taken_fields = AdminService.find_taken_fields(data['dni'], data['email'])
+        if 'dni' in taken_fields:
+            raise ValidationError({'dni': "El DNI ya existe."})
+
+        if 'email' in taken_fields:
+            raise ValidationError({'email': "El email ya existe."})
+
+        admin = AdminService._build_admin(data)
+
+        with transaction.atomic():
+            # bulk_create inserta sin pasar por save() y devuelve la PK generada,
+            # que se asigna a admin.user_id antes de la segunda inserción.
+            # Si otra petición concurrente insertó el mismo email o DNI después de
+            # la validación, el índice único lo rechaza y se revierte todo.
+            try:
+                User.objects.bulk_create([admin.user])
+            except IntegrityError:
+                raise ValidationError({'email': "El email ya existe."})
+
+            try:
+                Admin.objects.bulk_create([admin])
+            except IntegrityError:
+                raise ValidationError({'dni': "El DNI ya existe."})
+
+        return admin
+
+    @staticmethod
+    def bulk_create_admins(entries: list[dict]) -> list[Admin]:
+        """
+        Crea varios administradores (User + Admin) de una sola vez.
+        Valida todas las entradas antes de insertar: campos obligatorios, duplicados
+        dentro del lote y colisiones con datos existentes (en una sola consulta).
+        Luego inserta todos los usuarios y todos los perfiles con un bulk_create cada uno.
+        Si alguna entrada es inválida no se crea ningún administrador.
+        Retorna la lista de objetos Admin creados.
+        """
+        for data in entries:
+            AdminService._validate_admin_data(data)
+
+        dnis = [data['dni'] for data in entries]
+        # Mismo formato con el que build_user guarda el email (dominio en minúsculas)
+        emails = [User.objects.normalize_email(data['email']) for data in entries]
+        taken_dnis, taken_emails = AdminService.find_taken_values(dnis, emails)
+
+        # Repetidos dentro del propio lote o ya existentes en el sistema
+        repeated_dnis = {dni for dni, count in Counter(dnis).items() if count > 1}
+        repeated_emails = {email for email, count in Counter(emails).items() if count > 1}
+
+        errors = {}
+        invalid_dnis = sorted(taken_dnis | repeated_dnis)
+        invalid_emails = sorted(taken_emails | repeated_emails)
+        if invalid_dnis:
+            errors['dni'] = [f"El DNI {dni} ya existe o está repetido." for dni in invalid_dnis]
+        if invalid_emails:
+            errors['email'] = [f"El email {email} ya existe o está repetido." for email in invalid_emails]
+        if errors:
+            raise ValidationError(errors)
+
+        admins = [AdminService._build_admin(data) for data in entries]
+
+        with transaction.atomic():
+            try:
+                User.objects.bulk_create([admin.user for admin in admins])
+                Admin.objects.bulk_create(admins)
+            except IntegrityError:
+                raise ValidationError("Un DNI o email del lote fue registrado por otra operación.")
+
+        return admins
+
+    @staticmethod
+    def _validate_admin_data(data: dict) -> None:
+        """
+        Valida campos obligatorios y reglas de negocio que no requieren consultar la base de datos.
         """
         # Validar campos obligatorios
-        required_fields = ['name', 'surname', 'dni', 'email', 'hire_date', 'password']
-        missing_fields = [field for field in required_fields if field not in data or not data[field]]
+        missing_fields = [field for field in _REQUIRED_ADMIN_FIELDS if not data.get(field)]
         if missing_fields:
             raise ValidationError(f"Faltan campos obligatorios: {', '.join(missing_fields)}")
 
@@ -32,27 +118,24 @@ class AdminService:
         if data['hire_date'] > timezone.now().date():
             raise ValidationError({'hire_date': "La fecha de incorporación no puede ser futura."})
 
-        # Validaciones de unicidad
-        if not AdminService.validate_dni_unique(data['dni']):
-            raise ValidationError({'dni': "El DNI ya existe."})
-
-        if not AdminService.validate_email_unique(data['email']):
-            raise ValidationError({'email': "El email ya existe."})
-
-        # Crear User con rol ADMIN
-        # Este usuario tiene contraseña manual, no se toma desde DNI
-        user = User.objects.create_user(
+    @staticmethod
+    def _build_admin(data: dict) -> Admin:
+        """
+        Construye en memoria (sin guardar) el User con rol ADMIN y su Admin asociado.
+        El User queda accesible como admin.user. Ambos se insertan luego con bulk_create.
+        """
+        # Construir User con rol ADMIN (is_staff explícito, no hace falta verificarlo después)
+        # Este usuario tiene contraseña manual, no se toma desde DNI.
+        # El hash de la contraseña (costoso en CPU) se calcula fuera de la transacción.
+        user = User.objects.build_user(
             email=data['email'],
             role='ADMIN',
             password=data['password'],
+            is_staff=True,
         )
 
-        # Validar que user.is_staff sea True
-        if not user.is_staff:
-            raise ValidationError("El usuario ADMIN debe tener is_staff=True.")
-
-        # Crear Admin con campos de Person
-        admin = Admin.objects.create(
+        # Construir Admin con campos de Person
+        admin = Admin(
             user=user,
             name=data['name'],
             surname=data['surname'],
@@ -64,34 +147,60 @@ class AdminService:
             department=data.get('department', None),
         )
 
+        # bulk_create omite Admin.save(): aplicamos aquí la normalización y
+        # las validaciones de campo (la unicidad se verifica aparte)
+        admin.normalize_names()
+        admin.full_clean(exclude=['user'], validate_unique=False, validate_constraints=False)
+
         return admin
 
     @staticmethod
-    @transaction.atomic
-    def deactivate_admin(admin: Admin) -> None:
+    def deactivate_admin(admin_id: int, acting_user) -> None:
         """
         Desactiva un administrador estableciendo is_active=False en su usuario asociado.
         Esto previene que el administrador pueda iniciar sesión sin borrar sus datos.
+        Un administrador no puede desactivarse a sí mismo: la exclusión se resuelve
+        en la misma consulta UPDATE, sin cargar antes el Admin.
         """
-        # Verificación de seguridad por si la base de datos es inconsistente
-        if not admin.user:
-            raise ValidationError("El administrador no tiene un usuario asociado.")
-
         # Desactivamos SOLO el usuario de autenticación (Django User)
         # El perfil 'Admin' queda intacto como historial.
-        admin.user.is_active = False
-        admin.user.save(update_fields=['is_active'])
+        updated = (
+            User.objects.filter(admin_profile__pk=admin_id)
+            .exclude(pk=acting_user.pk)
+            .update(is_active=False)
+        )
+
+        if updated == 0:
+            raise ValidationError("No puedes desactivar tu propio usuario o el administrador no existe.")
 
     @staticmethod
     def activate_admin(admin: Admin):
         """
         Reactiva un administrador y su usuario asociado.
+        Usa un UPDATE directo: no carga el User ni dispara save() ni sus señales.
         """
-        if admin.user:
-            admin.user.is_active = True
-            admin.user.save(update_fields=['is_active'])
+        if admin.user_id:
+            User.objects.filter(pk=admin.user_id).update(is_active=True)
         return admin
 
+    @staticmethod
+    def activate_admins_bulk(queryset) -> int:
+        """
+        Reactiva en bloque los usuarios asociados a los administradores del queryset.
+        Ejecuta un único UPDATE en lugar de guardar cada usuario por separado.
+        Retorna la cantidad de usuarios actualizados.
+        """
+        return User.objects.filter(pk__in=queryset.values('user_id')).update(is_active=True)
+
+    @staticmethod
+    def deactivate_admins_bulk(queryset) -> int:
+        """
+        Desactiva en bloque los usuarios asociados a los administradores del queryset.
+        Ejecuta un único UPDATE en lugar de guardar cada usuario por separado.
+        Retorna la cantidad de usuarios actualizados.
+        """
+        return User.objects.filter(pk__in=queryset.values('user_id')).update(is_active=False)
+
     @staticmethod
     def validate_dni_unique(dni: str) -> bool:
         """
@@ -103,11 +212,57 @@ class AdminService:
         from students.models import Student
         from users.models import Teacher
 
-        exists_in_admin = Admin.objects.filter(dni=dni).exists()
-        exists_in_student = Student.objects.filter(dni=dni).exists()
-        exists_in_teacher = Teacher.objects.filter(dni=dni).exists()
+        # Una sola consulta (UNION) en lugar de tres exists() secuenciales
+        dni_in_use = Admin.objects.filter(dni=dni).values('dni').union(
+            Student.objects.filter(dni=dni).values('dni'),
+            Teacher.objects.filter(dni=dni).values('dni'),
+        )
+
+        return not dni_in_use.exists()
+
+    @staticmethod
+    def find_taken_fields(dni: str, email: str) -> set:
+        """
+        Verifica en una sola consulta si el DNI o el email ya están en uso.
+        Retorna el conjunto de campos ocupados ('dni' y/o 'email'); vacío si ambos están libres.
+        """
+        taken_dnis, taken_emails = AdminService.find_taken_values([dni], [email])
+
+        taken_fields = set()
+        if taken_dnis:
+            taken_fields.add('dni')
+        if taken_emails:
+            taken_fields.add('email')
+        return taken_fields
+
+    @staticmethod
+    def find_taken_values(dnis: list[str], emails: list[str]) -> tuple[set, set]:
+        """
+        Busca en una sola consulta (UNION) cuáles de los DNIs (Admin, Student, Teacher)
+        y emails (User) ya están en uso.
+        Los emails se normalizan igual que al crear el usuario antes de compararlos.
+        Retorna una tupla (dnis_ocupados, emails_ocupados).
+        """
+        # Importaciones locales para evitar dependencias circulares
+        from students.models import Student
+        from users.models import Teacher
+
+        def tagged(queryset, field):
+            # Cada rama del UNION devuelve el nombre del campo que colisiona y su valor
+            return queryset.order_by().annotate(field=Value(field)).values_list('field', field)
+
+        emails = [User.objects.normalize_email(email) for email in emails]
+
+        taken = tagged(Admin.objects.filter(dni__in=dnis), 'dni').union(
+            tagged(Student.objects.filter(dni__in=dnis), 'dni'),
+            tagged(Teacher.objects.filter(dni__in=dnis), 'dni'),
+            tagged(User.objects.filter(email__in=emails), 'email'),
+        )
 
-        return not (exists_in_admin or exists_in_student or exists_in_teacher)
+        taken_dnis, taken_emails = set(), set()
+        for field, value in taken:
+            (taken_dnis if field == 'dni' else taken_emails).add(value)
+        return taken_dnis, taken_emails
 
     @staticmethod
     def validate_email_unique(email: str) -> bool:
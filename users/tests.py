@@ -1,3 +1,48 @@
+import base64
+import json
+
 from django.test import TestCase
+from django.urls import reverse
+
+from users.models import User
+
+
+class KeysetPaginationCursorTests(TestCase):
+    """
+    Los cursores malformados de la paginación por cursor deben responder 404, nunca 500.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create_superuser(email="root@example.com", password="clave-segura")
+
+    def setUp(self):
+        self.client.force_login(self.superuser)
+
+    @staticmethod
+    def _cursor(raw):
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    def test_non_finite_numbers_are_rejected(self):
+        cases = [
+            ("users:admin_list", "after", '["2020-01-01", Infinity]'),
+            ("users:teacher_list", "before", '["a", "b", -Infinity]'),
+            ("users:admin_list", "after", '["2020-01-01", NaN]'),
+            ("users:admin_list", "after", '["2020-01-01", 1e400]'),
+            ("users:admin_list", "after", json.dumps(["2020-01-01", 10 ** 30])),
+        ]
+        for url_name, param, raw in cases:
+            with self.subTest(url=url_name, cursor=raw):
+                response = self.client.get(reverse(url_name), {param: self._cursor(raw)})
+                self.assertEqual(response.status_code, 404)
+
+    def test_malformed_cursors_are_rejected(self):
+        for raw in ["5", '["notadate", 3]', '[{"a": 1}, 2]', '["2020-01-01"]']:
+            with self.subTest(cursor=raw):
+                response = self.client.get(reverse("users:admin_list"), {"after": self._cursor(raw)})
+                self.assertEqual(response.status_code, 404)
 
-# Create your tests here.
+    def test_valid_cursor_is_accepted(self):
+        cursor = self._cursor(json.dumps(["2020-01-01", 3]))
+        response = self.client.get(reverse("users:admin_list"), {"after": cursor})
+        self.assertEqual(response.status_code, 200)
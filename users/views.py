@@ -1,7 +1,9 @@
 from django.contrib.auth import update_session_auth_hash
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.views import PasswordChangeView
+from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.db.models import Prefetch
 from django.http import HttpResponseRedirect
 from django.shortcuts import redirect
 from django.views import View
@@ -9,10 +11,12 @@ from django.views.generic import TemplateView, ListView
 from django.views.generic.detail import SingleObjectMixin
 from django.views.generic.edit import FormView, DeleteView
 from django.urls import reverse_lazy
+from django.utils.cache import patch_cache_control, patch_vary_headers
 from django.contrib import messages
 
+from subjects.models import Subject
 from .forms import AdminCreateForm, TeacherCreateForm, FirstLoginPasswordChangeForm
-from .mixins import SuperuserRequiredMixin, AdminRequiredMixin
+from .mixins import SuperuserRequiredMixin, AdminRequiredMixin, KeysetPaginationMixin
 from .models import Admin, Teacher
 from .services.auth_service import AuthService
 from .services import AdminService
@@ -29,7 +33,14 @@ class HomeView(TemplateView):
             return redirect('dashboard')
 
         # Si es anónimo, continúa con la vista Home
-        return super().dispatch(request, *args, **kwargs)
+        response = super().dispatch(request, *args, **kwargs)
+
+        # La página anónima es igual para todos: se permite cachearla en proxies.
+        # Vary: Cookie evita servirla a quien tenga sesión; la redirección al
+        # Dashboard no se marca como cacheable.
+        patch_cache_control(response, public=True, max_age=60)
+        patch_vary_headers(response, ("Cookie",))
+        return response
 
 
 # Vista Dashboard (para usuarios autenticados)
@@ -45,14 +56,18 @@ class ProfileView(LoginRequiredMixin, TemplateView):
     redirect_field_name = 'next'
 
 
-class AdminListView(SuperuserRequiredMixin, ListView):
+class AdminListView(SuperuserRequiredMixin, KeysetPaginationMixin, ListView):
     model = Admin
     template_name = "users/admin_list.html"
     context_object_name = "admins"
     paginate_by = 20
+    keyset_ordering = ("-hire_date", "-pk")
 
     def get_queryset(self):
-        return Admin.objects.all().select_related('user')
+        # Solo las columnas que usa el listado (y las del cursor de paginación)
+        return Admin.objects.select_related('user').only(
+            'dni', 'name', 'surname', 'department', 'hire_date', 'user__email', 'user__is_active',
+        )
 
 
 class AdminCreateView(SuperuserRequiredMixin, FormView):
@@ -76,29 +91,21 @@ class AdminCreateView(SuperuserRequiredMixin, FormView):
             return self.form_invalid(form)
 
 
-class AdminDeleteView(SuperuserRequiredMixin, SingleObjectMixin, View):
+class AdminDeleteView(SuperuserRequiredMixin, View):
     """
     Vista personalizada para DESACTIVAR (Soft Delete) un admin.
     No usamos DeleteView para evitar borrados accidentales de SQL.
     """
-    model = Admin
     success_url = reverse_lazy("users:admin_list")
 
     def post(self, request, *args, **kwargs):
-        # Obtenemos el objeto basado en la URL (pk)
-        self.object = self.get_object()
-        admin_obj = self.object
-
-        # Seguridad: No auto-desactivarse
-        if admin_obj.user == request.user:
-            messages.error(request, "No puedes desactivar tu propio usuario.")
-            return redirect(self.success_url)
-
         try:
-            # Lógica de Soft Delete
-            AdminService.deactivate_admin(admin_obj)
+            # Lógica de Soft Delete (el servicio impide auto-desactivarse)
+            AdminService.deactivate_admin(kwargs["pk"], request.user)
 
-            messages.success(request, f"Administrador {admin_obj.surname} desactivado correctamente.")
+            messages.success(request, "Administrador desactivado correctamente.")
+        except ValidationError as e:
+            messages.error(request, e.messages[0])
         except Exception as e:
             messages.error(request, f"Error al desactivar: {str(e)}")
 
@@ -108,7 +115,7 @@ class AdminDeleteView(SuperuserRequiredMixin, SingleObjectMixin, View):
 class AdminActivateView(SuperuserRequiredMixin, SingleObjectMixin, View):
     """
     Vista personalizada para REACTIVAR un admin (Undo Soft Delete).
-    Sigue el mismo patrón que AdminDeleteView para mantener consistencia.
+    Carga el Admin por pk con SingleObjectMixin y delega la reactivación en AdminService.
     """
     model = Admin
     success_url = reverse_lazy("users:admin_list")
@@ -144,16 +151,21 @@ class TeacherCreateView(AdminRequiredMixin, FormView):
             return self.form_invalid(form)
 
 
-class TeacherListView(AdminRequiredMixin, ListView):
+class TeacherListView(AdminRequiredMixin, KeysetPaginationMixin, ListView):
     model = Teacher
     template_name = "users/teacher_list.html"
     context_object_name = "teachers"
     paginate_by = 20
+    # El orden lo aplica la paginación por cursor (pk desempata)
+    keyset_ordering = ("surname", "name", "pk")
 
     def get_queryset(self):
         # Optimizamos la consulta para traer los datos del Usuario relacionado
         # en el mismo viaje a la base de datos (evita N+1 queries).
-        return Teacher.objects.select_related('user').all().order_by('surname', 'name')
+        # Solo se cargan las columnas que usa el listado (y las del cursor de paginación).
+        return Teacher.objects.select_related('user').only(
+            'name', 'surname', 'dni', 'academic_degree', 'phone', 'hire_date', 'user__email', 'user__is_active',
+        )
 
 
 class TeacherDeleteView(AdminRequiredMixin, DeleteView):
@@ -165,10 +177,17 @@ class TeacherDeleteView(AdminRequiredMixin, DeleteView):
     context_object_name = "teacher"
     success_url = reverse_lazy("users:teacher_list")
 
+    def get_queryset(self):
+        # Traemos el usuario en la misma consulta y las materias en una sola consulta extra,
+        # cargando solo las columnas que usa la plantilla (teacher es necesario para el prefetch).
+        return Teacher.objects.select_related('user').prefetch_related(
+            Prefetch('subjects', queryset=Subject.objects.only('id', 'name', 'teacher'))
+        )
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         teacher = self.object
-        # Consultar las materias asignadas al profesor
+        # Materias asignadas al profesor (ya precargadas por get_queryset)
         context["assigned_subjects"] = teacher.subjects.all()
         return context
 